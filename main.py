@@ -4,62 +4,118 @@ Main application for crawl-news: BFS web crawler for news articles.
 
 import asyncio
 import logging
-from collections import deque
-from crawl4ai import AsyncWebCrawler
 
-from utils.config import INITIAL_URL, DATA_STORE_DIR, setup_config
-from utils.url_utils import get_domain, extract_news_urls
-from utils.crawler_utils import create_crawler_config, crawl_and_extract_content
+from utils.config import (
+    INITIAL_URL,
+    DATA_STORE_DIR,
+    NUM_WORKERS,
+    MAX_CONCURRENT_REQUESTS,
+    REQUESTS_PER_SECOND,
+    REQUEST_BURST,
+    VISITED_URLS_CAPACITY,
+    VISITED_URLS_ERROR_RATE,
+    setup_config,
+)
+from utils.bloom_filter import BloomFilter
+from utils.rate_limiter import DomainRateLimiter
+from utils.storage import ResultStore
+from utils.url_utils import get_domain, extract_news_urls, is_news_article_url
+from utils.crawler_utils import (
+    create_browser_config,
+    create_crawler_config,
+    crawl_and_extract_content,
+)
 
 
 async def main(start_url: str):
     """
     Main function to perform BFS crawling starting from start_url.
+
+    The frontier is an asyncio.Queue drained by NUM_WORKERS worker tasks; a
+    semaphore caps the number of in-flight fetches at MAX_CONCURRENT_REQUESTS
+    and a per-domain token bucket keeps the request rate polite.
     """
     base_domain = get_domain(start_url)
     if not base_domain:
         logging.error(
-            f"Could not determine base domain from initial URL: {start_url}. Exiting."
+            "Could not determine base domain from initial URL: %s. Exiting.", start_url
         )
         return
 
     logging.info(
-        f"Starting crawl with initial URL: {start_url} (Base Domain: {base_domain})"
+        "Starting crawl with initial URL: %s (Base Domain: %s)", start_url, base_domain
     )
 
-    crawler_config = create_crawler_config()
-    urls_to_visit = deque([start_url])
-    visited_urls = set()
-
-    async with AsyncWebCrawler() as crawler:
-        while urls_to_visit:
-            current_url = urls_to_visit.popleft()
+    from crawl4ai import AsyncWebCrawler
 
-            if current_url in visited_urls:
-                logging.info(f"Skipping already visited URL: {current_url}")
-                continue
+    # Only article pages go through LLM extraction; other pages are link hubs
+    article_config = create_crawler_config()
+    link_hub_config = create_crawler_config(extract_news=False)
+    urls_to_visit: asyncio.Queue[str] = asyncio.Queue()
+    # URLs are marked as seen when enqueued, so each one is fetched at most once.
+    # The event loop is single-threaded, so the check-and-add needs no lock.
+    # A Bloom filter keeps memory bounded on large crawls; a false positive
+    # only means a URL is (rarely) skipped.
+    visited_urls = BloomFilter(VISITED_URLS_CAPACITY, VISITED_URLS_ERROR_RATE)
+    visited_urls.add(start_url)
+    urls_to_visit.put_nowait(start_url)
+    fetch_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    rate_limiter = DomainRateLimiter(REQUESTS_PER_SECOND, REQUEST_BURST)
+    store = ResultStore(DATA_STORE_DIR / base_domain)
 
-            visited_urls.add(current_url)
+    try:
+        async with AsyncWebCrawler(config=create_browser_config()) as crawler:
 
-            markdown_content = await crawl_and_extract_content(
-                url=current_url,
-                crawler=crawler,
-                config=crawler_config,
-                base_data_dir=DATA_STORE_DIR,
-                target_domain=base_domain,
-            )
+            async def worker(worker_id: int):
+                while True:
+                    current_url = await urls_to_visit.get()
+                    try:
+                        async with fetch_semaphore:
+                            markdown_content = await crawl_and_extract_content(
+                                url=current_url,
+                                crawler=crawler,
+                                config=(
+                                    article_config
+                                    if is_news_article_url(current_url)
+                                    else link_hub_config
+                                ),
+                                store=store,
+                                target_domain=base_domain,
+                                rate_limiter=rate_limiter,
+                            )
 
-            if markdown_content:
-                new_urls = extract_news_urls(markdown_content, base_domain, current_url)
-                for new_url in new_urls:
-                    if new_url not in visited_urls and new_url not in urls_to_visit:
-                        urls_to_visit.append(new_url)
-                        logging.info(f"Added to queue: {new_url}")
+                        if markdown_content:
+                            # Link extraction is CPU-bound; keep it off the event loop
+                            new_urls = await asyncio.to_thread(
+                                extract_news_urls,
+                                markdown_content,
+                                base_domain,
+                                current_url,
+                            )
+                            for new_url in new_urls:
+                                if new_url not in visited_urls:
+                                    visited_urls.add(new_url)
+                                    urls_to_visit.put_nowait(new_url)
+                                    logging.info("Added to queue: %s", new_url)
+                    except Exception as e:
+                        logging.error(
+                            "Worker %d failed on %s: %s", worker_id, current_url, e
+                        )
+                    finally:
+                        urls_to_visit.task_done()
 
-            # Optional: Add a small delay to be polite to the server
-            await asyncio.sleep(1)  # 1-second delay
+            workers = [asyncio.create_task(worker(i)) for i in range(NUM_WORKERS)]
+            try:
+                await urls_to_visit.join()
+            finally:
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+    finally:
+        # Close the store even if the crawler fails to start or the crawl aborts
+        await store.close()
 
-    logging.info(f"Crawling finished. Visited {len(visited_urls)} URLs.")
+    logging.info("Crawling finished. Queued about %d unique URLs.", len(visited_urls))
 
 
 if __name__ == "__main__":
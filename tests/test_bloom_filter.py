@@ -0,0 +1,35 @@
+import unittest
+
+from utils.bloom_filter import BloomFilter
+
+URLS = [f"https://merolagani.com/NewsDetail.aspx?newsID={i}" for i in range(10000)]
+
+
+class BloomFilterTest(unittest.TestCase):
+    def test_no_false_negatives(self):
+        bloom = BloomFilter(capacity=len(URLS), error_rate=0.01)
+        for url in URLS:
+            bloom.add(url)
+        for url in URLS:
+            self.assertIn(url, bloom)
+
+    def test_false_positive_rate(self):
+        added, others = URLS[:5000], URLS[5000:]
+        bloom = BloomFilter(capacity=len(added), error_rate=0.01)
+        for url in added:
+            bloom.add(url)
+        false_positives = sum(url in bloom for url in others)
+        self.assertLess(false_positives / len(others), 0.03)
+
+    def test_len_tracks_distinct_adds(self):
+        bloom = BloomFilter(capacity=len(URLS), error_rate=1e-7)
+        self.assertEqual(len(bloom), 0)
+        for url in URLS:
+            bloom.add(url)
+        for url in URLS[:100]:
+            bloom.add(url)
+        self.assertEqual(len(bloom), len(URLS))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+import asyncio
+import time
+import unittest
+
+from utils.rate_limiter import DomainRateLimiter
+
+
+class DomainRateLimiterTest(unittest.TestCase):
+    def _time_acquires(self, limiter, domains):
+        async def run():
+            start = time.monotonic()
+            await asyncio.gather(*(limiter.acquire(domain) for domain in domains))
+            return time.monotonic() - start
+
+        return asyncio.run(run())
+
+    def test_acquires_are_spaced_by_rate(self):
+        # The first request goes out at once; each later one waits 1 / rps
+        elapsed = self._time_acquires(DomainRateLimiter(20), ["a.com"] * 5)
+        self.assertAlmostEqual(elapsed, 4 / 20, delta=0.1)
+
+    def test_burst_is_not_throttled(self):
+        elapsed = self._time_acquires(DomainRateLimiter(1, burst=3), ["a.com"] * 3)
+        self.assertLess(elapsed, 0.1)
+
+    def test_domains_are_limited_independently(self):
+        elapsed = self._time_acquires(DomainRateLimiter(1), ["a.com", "b.com"])
+        self.assertLess(elapsed, 0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
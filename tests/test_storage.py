@@ -0,0 +1,81 @@
+import asyncio
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from utils.storage import ResultStore
+
+
+class ResultStoreTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.domain_dir = Path(self._tmp.name) / "merolagani.com"
+
+    def test_put_get_contains(self):
+        async def run():
+            store = ResultStore(self.domain_dir)
+            try:
+                self.assertNotIn("abc", store)
+                self.assertIsNone(await store.get("abc"))
+                await store.put("abc", "https://merolagani.com/x", "# x", "[]")
+                self.assertIn("abc", store)
+                return await store.get("abc")
+            finally:
+                await store.close()
+
+        self.assertEqual(
+            asyncio.run(run()),
+            {
+                "fingerprint": "abc",
+                "url": "https://merolagani.com/x",
+                "markdown": "# x",
+                "extracted_content": "[]",
+            },
+        )
+
+    def test_reopen_reloads_fingerprints(self):
+        async def run():
+            store = ResultStore(self.domain_dir)
+            await store.put("abc", "https://merolagani.com/x", "# x", None)
+            await store.close()
+
+            store = ResultStore(self.domain_dir)
+            try:
+                self.assertIn("abc", store)
+                return (await store.get("abc"))["markdown"]
+            finally:
+                await store.close()
+
+        self.assertEqual(asyncio.run(run()), "# x")
+
+    def test_imports_legacy_results(self):
+        url = "https://merolagani.com/NewsDetail.aspx?newsID=1"
+        content = json.dumps([{"title": "t", "content": "c", "url": url}])
+        legacy_path = self.domain_dir / "abc" / "result.json"
+        legacy_path.parent.mkdir(parents=True)
+        legacy_path.write_text(content, encoding="utf-8")
+
+        async def run():
+            store = ResultStore(self.domain_dir)
+            try:
+                self.assertIn("abc", store)
+                return await store.get("abc")
+            finally:
+                await store.close()
+
+        self.assertEqual(
+            asyncio.run(run()),
+            {
+                "fingerprint": "abc",
+                "url": url,
+                "markdown": None,
+                "extracted_content": content,
+            },
+        )
+        self.assertTrue(legacy_path.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+import importlib.util
+import re
+import sys
+import types
+import unittest
+from unittest import mock
+
+from utils import url_utils
+
+BASE_DOMAIN = "merolagani.com"
+CURRENT_PAGE = "https://merolagani.com/NewsDetail.aspx?newsID=1"
+
+PARITY_CASES = [
+    "[t](https://merolagani.com/NewsDetail.aspx?newsID=5)",
+    '[t](https://merolagani.com/NewsDetail.aspx?newsID=7 "Title")',
+    '[t](/NewsDetail.aspx?newsID=8 "x")',
+    "[x](<https://merolagani.com/NewsDetail.aspx?newsID=20>)",
+    "[x](NewsDetail.aspx?newsID=21)",
+    "[x](/NewsDetail.aspx?newsID=9#top)",
+    "See https://merolagani.com/NewsDetail.aspx?newsID=10 and /NewsDetail.aspx?newsID=11",
+    "[ https://merolagani.com/NewsDetail.aspx?newsID=12 [t](/NewsDetail.aspx?newsID=13)",
+    "[![img](/images/a.png)](https://merolagani.com/NewsDetail.aspx?newsID=14)",
+    "[x](https://example.com/NewsDetail.aspx?newsID=3)",
+    "[x](/NewsDetail.aspx?newsID=abc)",
+    "See https://merolagani.com/NewsDetail.aspx?newsID=5\xa0today",
+    "[https://merolagani.com/NewsDetail.aspx?newsID=5 more](/x)",
+    "](foohttps://merolagani.com/NewsDetail.aspx?newsID=5)",
+    "[two\nlines](/NewsDetail.aspx?newsID=15) [x](\nNewsDetail.aspx?newsID=16)",
+]
+
+
+def extract(markdown_content: str, module=url_utils) -> set[str]:
+    return module.extract_news_urls(markdown_content, BASE_DOMAIN, CURRENT_PAGE)
+
+
+def _load_url_utils(hyperscan_module):
+    """
+    Loads a private copy of url_utils with `hyperscan_module` in place of the
+    real package; None makes the import fail so the re backend is used.
+    """
+    spec = importlib.util.spec_from_file_location(
+        "url_utils_under_test", url_utils.__file__
+    )
+    module = importlib.util.module_from_spec(spec)
+    with mock.patch.dict(sys.modules, {"hyperscan": hyperscan_module}):
+        spec.loader.exec_module(module)
+    return module
+
+
+def _stub_hyperscan():
+    """A hyperscan stand-in that reports literal matches of the database pattern."""
+
+    class Database:
+        def compile(self, expressions, ids, elements, flags):
+            self._pattern = re.compile(expressions[0], re.IGNORECASE)
+
+        def scan(self, data, match_event_handler, context=None, scratch=None):
+            for match in self._pattern.finditer(data):
+                match_event_handler(0, match.start(), match.end(), 0, context)
+
+    stub = types.ModuleType("hyperscan")
+    stub.Database = Database
+    stub.Scratch = lambda database: None
+    stub.HS_FLAG_CASELESS = 1
+    stub.HS_FLAG_SOM_LEFTMOST = 2
+    return stub
+
+
+class ExtractNewsUrlsTest(unittest.TestCase):
+    def test_plain_markdown_link(self):
+        self.assertEqual(
+            extract("[t](https://merolagani.com/NewsDetail.aspx?newsID=5)"),
+            {"https://merolagani.com/NewsDetail.aspx?newsID=5"},
+        )
+
+    def test_titled_absolute_link(self):
+        self.assertEqual(
+            extract('[t](https://merolagani.com/NewsDetail.aspx?newsID=7 "Title")'),
+            {"https://merolagani.com/NewsDetail.aspx?newsID=7"},
+        )
+
+    def test_titled_relative_link(self):
+        self.assertEqual(
+            extract('[t](/NewsDetail.aspx?newsID=8 "x")'),
+            {"https://merolagani.com/NewsDetail.aspx?newsID=8"},
+        )
+
+    def test_angle_bracket_link(self):
+        self.assertEqual(
+            extract("[x](<https://merolagani.com/NewsDetail.aspx?newsID=20>)"),
+            {"https://merolagani.com/NewsDetail.aspx?newsID=20"},
+        )
+
+    def test_url_after_unclosed_bracket(self):
+        self.assertEqual(
+            extract(
+                "[ https://merolagani.com/NewsDetail.aspx?newsID=12"
+                " [t](/NewsDetail.aspx?newsID=13)"
+            ),
+            {
+                "https://merolagani.com/NewsDetail.aspx?newsID=12",
+                "https://merolagani.com/NewsDetail.aspx?newsID=13",
+            },
+        )
+
+    def test_url_in_link_text(self):
+        self.assertEqual(
+            extract(
+                "[https://merolagani.com/NewsDetail.aspx?newsID=5 more]"
+                "(/NewsDetail.aspx?newsID=6)"
+            ),
+            {
+                "https://merolagani.com/NewsDetail.aspx?newsID=5",
+                "https://merolagani.com/NewsDetail.aspx?newsID=6",
+            },
+        )
+
+    def test_fragment_is_dropped(self):
+        self.assertEqual(
+            extract("[x](/NewsDetail.aspx?newsID=9#top)"),
+            {"https://merolagani.com/NewsDetail.aspx?newsID=9"},
+        )
+
+    def test_news_id_key_is_case_sensitive(self):
+        self.assertEqual(
+            extract(
+                "[a](/NewsDetail.aspx?newsid=12) [b](/NewsDetail.aspx?newsID=12)"
+            ),
+            {"https://merolagani.com/NewsDetail.aspx?newsID=12"},
+        )
+
+    def test_percent_encoded_news_id(self):
+        self.assertEqual(
+            extract("[x](/NewsDetail.aspx?newsID=%314)"),
+            {"https://merolagani.com/NewsDetail.aspx?newsID=%314"},
+        )
+
+    def test_other_domain_is_rejected(self):
+        self.assertEqual(
+            extract("[x](https://example.com/NewsDetail.aspx?newsID=3)"), set()
+        )
+
+
+class HyperscanParityTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.re_url_utils = _load_url_utils(None)
+        cls.hyperscan_url_utils = _load_url_utils(_stub_hyperscan())
+
+    def test_backends_agree(self):
+        self.assertIsNone(self.re_url_utils.hyperscan)
+        self.assertIsNotNone(self.hyperscan_url_utils.hyperscan)
+        for markdown_content in PARITY_CASES:
+            with self.subTest(markdown_content=markdown_content):
+                self.assertEqual(
+                    extract(markdown_content, self.hyperscan_url_utils),
+                    extract(markdown_content, self.re_url_utils),
+                )
+
+    def test_backends_agree_on_whole_page(self):
+        markdown_content = "\n".join(PARITY_CASES)
+        self.assertEqual(
+            extract(markdown_content, self.hyperscan_url_utils),
+            extract(markdown_content, self.re_url_utils),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
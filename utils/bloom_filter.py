@@ -0,0 +1,51 @@
+"""
+Bloom filter used to track visited URLs for the crawl-news application.
+"""
+
+import math
+from hashlib import blake2b
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings.
+
+    Membership tests never give false negatives; false positives occur at
+    roughly `error_rate` as long as no more than `capacity` items are added.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.num_bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._count = 0
+
+    def _bit_positions(self, item: str):
+        # Double hashing: derive all k positions from one 128-bit digest
+        digest = blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item: str) -> None:
+        """Adds an item to the filter."""
+        is_new = False
+        for position in self._bit_positions(item):
+            byte_index, bit = divmod(position, 8)
+            if not self._bits[byte_index] & (1 << bit):
+                self._bits[byte_index] |= 1 << bit
+                is_new = True
+        if is_new:
+            self._count += 1
+
+    def __contains__(self, item: str) -> bool:
+        for position in self._bit_positions(item):
+            byte_index, bit = divmod(position, 8)
+            if not self._bits[byte_index] & (1 << bit):
+                return False
+        return True
+
+    def __len__(self) -> int:
+        """Approximate number of distinct items added."""
+        return self._count
@@ -10,6 +10,21 @@ from dotenv import load_dotenv
 INITIAL_URL = "https://merolagani.com/NewsDetail.aspx?newsID=114689"
 DATA_STORE_DIR = Path(__file__).parent.parent / "data"
 
+# Concurrency settings
+NUM_WORKERS = 20  # Worker tasks pulling URLs from the BFS queue
+MAX_CONCURRENT_REQUESTS = 10  # Upper bound on in-flight fetches
+REQUESTS_PER_SECOND = 1  # Politeness cap on fetches per domain
+REQUEST_BURST = 1  # Requests allowed back-to-back before throttling
+
+# Browser settings
+# Opt-in: crawl4ai's text mode launches the browser with JavaScript and images
+# disabled, which is lighter but can change or blank JS-rendered pages.
+BROWSER_TEXT_MODE = False
+
+# Visited-URL Bloom filter sizing
+VISITED_URLS_CAPACITY = 1_000_000  # Expected number of URLs in a crawl
+VISITED_URLS_ERROR_RATE = 1e-7  # False-positive rate at full capacity
+
 # Initialize configuration
 def setup_config():
     """Initialize application configuration."""
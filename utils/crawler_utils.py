@@ -2,25 +2,62 @@
 Crawler utility functions for the crawl-news application.
 """
 
+from __future__ import annotations
+
 import logging
-from pathlib import Path
-from crawl4ai import (
-    AsyncWebCrawler,
-    PruningContentFilter,
-    DefaultMarkdownGenerator,
-    CrawlerRunConfig,
-    LLMExtractionStrategy,
-    LLMConfig,
-)
-
-from .models import NewsData
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from .config import BROWSER_TEXT_MODE
+from .rate_limiter import DomainRateLimiter
+from .storage import ResultStore
 from .url_utils import get_domain, get_url_fingerprint
 
+# crawl4ai pulls in Playwright, Pydantic schemas and LLM clients, so it is
+# only imported when a config is actually built.
+if TYPE_CHECKING:
+    from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig
+
+
+@lru_cache(maxsize=1)
+def _news_schema() -> dict:
+    """JSON schema of NewsData, generated once and reused by every config."""
+    from .models import NewsData
+
+    return NewsData.model_json_schema()
+
+
+def create_browser_config() -> BrowserConfig:
+    """
+    Creates and returns the browser configuration used by the shared crawler.
+    Text mode (JavaScript and images disabled) is enabled only when
+    BROWSER_TEXT_MODE is set in utils/config.py.
+    """
+    from crawl4ai import BrowserConfig
+
+    return BrowserConfig(headless=True, text_mode=BROWSER_TEXT_MODE)
+
+
+def create_crawler_config(extract_news: bool = True) -> CrawlerRunConfig:
+    """
+    Creates and returns the crawler configuration.
+
+    With extract_news=False the LLM extraction strategy is left out, for pages
+    that are only crawled for their links.
+    """
+    from crawl4ai import (
+        PruningContentFilter,
+        DefaultMarkdownGenerator,
+        CrawlerRunConfig,
+        LLMExtractionStrategy,
+        LLMConfig,
+    )
 
-def create_crawler_config() -> CrawlerRunConfig:
-    """Creates and returns the crawler configuration."""
     prune_filter = PruningContentFilter(min_word_threshold=5)
     md_generator = DefaultMarkdownGenerator(content_filter=prune_filter)
+    if not extract_news:
+        return CrawlerRunConfig(markdown_generator=md_generator)
+
     llm_config = LLMConfig(
         provider="gemini/gemini-2.0-flash",
         max_tokens=1000,
@@ -32,7 +69,7 @@ def create_crawler_config() -> CrawlerRunConfig:
         markdown_generator=md_generator,
         extraction_strategy=LLMExtractionStrategy(
             llm_config=llm_config,
-            schema=NewsData.model_json_schema(),
+            schema=_news_schema(),
             extraction_type="schema",
             extraction_instruction="Extract the news data from the markdown content",
             verbose=True,
@@ -44,51 +81,60 @@ async def crawl_and_extract_content(
     url: str,
     crawler: AsyncWebCrawler,
     config: CrawlerRunConfig,
-    base_data_dir: Path,
+    store: ResultStore,
     target_domain: str,
+    rate_limiter: DomainRateLimiter,
 ) -> str | None:
     """
     Crawls a single URL, saves its markdown content, and returns the markdown.
-    Returns None if crawling fails or content is not relevant.
+    Returns None if crawling fails, content is not relevant, or the stored
+    result has no markdown.
     """
-    logging.info(f"Processing URL: {url}")
+    logging.info("Processing URL: %s", url)
 
     current_domain = get_domain(url)
     if not current_domain or current_domain.lower() != target_domain.lower():
         logging.warning(
-            f"Skipping URL {url} as its domain '{current_domain}' does not match target '{target_domain}'"
+            "Skipping URL %s as its domain '%s' does not match target '%s'",
+            url,
+            current_domain,
+            target_domain,
         )
         return None
 
     url_fingerprint = get_url_fingerprint(url)
-    # Path for storing data for this specific URL: data/<domain>/<fingerprint>/result.md
-    data_storage_path_for_url = base_data_dir / current_domain / url_fingerprint
-    data_storage_path_for_url.mkdir(parents=True, exist_ok=True)
-    json_file_path = data_storage_path_for_url / "result.json"
-
-    if json_file_path.exists():
-        logging.info(
-            f"JSON file already exists for {url} at {json_file_path}, reading from disk."
-        )
+    if url_fingerprint in store:
+        logging.info("Result already stored for %s, reading from disk.", url)
         try:
-            return json_file_path.read_text(encoding="utf-8")
+            markdown = (await store.get(url_fingerprint))["markdown"]
+            if markdown is None:
+                # Imported legacy result: the article is stored, but not its links
+                logging.info("Stored result for %s has no markdown to scan.", url)
+            return markdown
         except Exception as e:
-            logging.error(f"Error reading existing JSON file for {url}: {e}")
+            logging.error("Error reading stored result for %s: %s", url, e)
             # Proceed to re-crawl if reading fails
 
     try:
+        await rate_limiter.acquire(current_domain)
         result = await crawler.arun(url=url, config=config)
         if result.success and result.markdown:
-            logging.info(f"Successfully crawled: {url}")
-            with open(json_file_path, "w", encoding="utf-8") as f:
-                f.write(result.extracted_content)
-            logging.info(f"Stored JSON for {url} at {json_file_path}")
+            logging.info("Successfully crawled: %s", url)
+            await store.put(
+                fingerprint=url_fingerprint,
+                url=url,
+                markdown=str(result.markdown),
+                extracted_content=result.extracted_content,
+            )
+            logging.info("Stored result for %s", url)
             return result.markdown
         else:
             logging.error(
-                f"Failed to crawl or get JSON for {url}. Error: {result.error if result else 'Unknown error'}"
+                "Failed to crawl or get JSON for %s. Error: %s",
+                url,
+                result.error if result else "Unknown error",
             )
             return None
     except Exception as e:
-        logging.error(f"Exception during crawling {url}: {e}")
+        logging.error("Exception during crawling %s: %s", url, e)
         return None 
\ No newline at end of file
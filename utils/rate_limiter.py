@@ -0,0 +1,53 @@
+"""
+Per-domain request rate limiting for the crawl-news application.
+"""
+
+import asyncio
+import time
+
+
+class _TokenBucket:
+    """Token bucket refilled at `rate` tokens per second, holding at most `capacity`."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.last_refill) * self.rate
+        )
+        self.last_refill = now
+
+    async def acquire(self) -> None:
+        # Waiters queue on the lock, so tokens are handed out in FIFO order
+        async with self.lock:
+            self._refill()
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+
+
+class DomainRateLimiter:
+    """
+    Caps the request rate to each domain independently, so concurrent workers
+    can fetch in parallel without exceeding `requests_per_second` per domain.
+    """
+
+    def __init__(self, requests_per_second: float, burst: int = 1):
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self._buckets: dict[str, _TokenBucket] = {}
+
+    async def acquire(self, domain: str) -> None:
+        """Waits until a request to `domain` is allowed."""
+        bucket = self._buckets.get(domain)
+        if bucket is None:
+            bucket = _TokenBucket(self.requests_per_second, self.burst)
+            self._buckets[domain] = bucket
+        await bucket.acquire()
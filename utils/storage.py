@@ -0,0 +1,136 @@
+"""
+Result storage for the crawl-news application.
+
+Crawled pages are stored in a single SQLite database per domain,
+data/<domain>/results.sqlite3, keyed by URL fingerprint. Results written by
+earlier versions as data/<domain>/<fingerprint>/result.json are imported
+into it on first use.
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+
+
+class ResultStore:
+    """SQLite-backed store of crawl results for a single domain."""
+
+    def __init__(self, domain_dir: Path):
+        self.domain_dir = domain_dir
+        self.domain_dir.mkdir(parents=True, exist_ok=True)
+        # Queries run in worker threads so they don't block the event loop;
+        # the lock serializes access to the shared connection.
+        self._db = sqlite3.connect(
+            self.domain_dir / "results.sqlite3", check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        # WAL lets reads proceed during writes and keeps commits from fsyncing
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pages (
+                fingerprint TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                markdown TEXT,
+                extracted_content TEXT
+            )
+            """
+        )
+        self._db.commit()
+        # Fingerprints already stored, loaded once so cache misses need no query
+        self._fingerprints = {
+            fingerprint
+            for (fingerprint,) in self._db.execute("SELECT fingerprint FROM pages")
+        }
+        self._import_legacy_results()
+
+    def _import_legacy_results(self) -> None:
+        """
+        Imports per-page result.json files that aren't in the database yet.
+        Those files hold only the extracted content, so markdown is left NULL.
+        The files themselves are kept.
+        """
+        imported = 0
+        for result_path in sorted(self.domain_dir.glob("*/result.json")):
+            fingerprint = result_path.parent.name
+            if fingerprint in self._fingerprints:
+                continue
+            try:
+                extracted_content = result_path.read_text(encoding="utf-8")
+                items = json.loads(extracted_content)
+                url = items[0].get("url", "") if items else ""
+            except (OSError, ValueError, LookupError, AttributeError) as e:
+                logging.error("Error importing legacy result %s: %s", result_path, e)
+                continue
+            self._insert(fingerprint, url or "", None, extracted_content)
+            self._fingerprints.add(fingerprint)
+            imported += 1
+        if imported:
+            logging.info(
+                "Imported %d legacy results from %s", imported, self.domain_dir
+            )
+
+    def __contains__(self, fingerprint: str) -> bool:
+        return fingerprint in self._fingerprints
+
+    def _fetch(self, fingerprint: str) -> dict | None:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT url, markdown, extracted_content FROM pages"
+                " WHERE fingerprint = ?",
+                (fingerprint,),
+            ).fetchone()
+        if row is None:
+            return None
+        url, markdown, extracted_content = row
+        return {
+            "fingerprint": fingerprint,
+            "url": url,
+            "markdown": markdown,
+            "extracted_content": extracted_content,
+        }
+
+    def _insert(
+        self,
+        fingerprint: str,
+        url: str,
+        markdown: str | None,
+        extracted_content: str | None,
+    ) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?)",
+                (fingerprint, url, markdown, extracted_content),
+            )
+            self._db.commit()
+
+    async def get(self, fingerprint: str) -> dict | None:
+        """
+        Returns the stored record for a fingerprint, or None if absent.
+        Imported legacy records have no markdown.
+        """
+        if fingerprint not in self._fingerprints:
+            return None
+        return await asyncio.to_thread(self._fetch, fingerprint)
+
+    async def put(
+        self,
+        fingerprint: str,
+        url: str,
+        markdown: str,
+        extracted_content: str | None,
+    ) -> None:
+        """Stores the record for a fingerprint, replacing any previous one."""
+        await asyncio.to_thread(
+            self._insert, fingerprint, url, markdown, extracted_content
+        )
+        self._fingerprints.add(fingerprint)
+
+    async def close(self) -> None:
+        """Closes the database."""
+        with self._lock:
+            self._db.close()
@@ -5,28 +5,160 @@ URL utility functions for the crawl-news application.
 import re
 import hashlib
 import logging
+import threading
+from functools import lru_cache
 from urllib.parse import urlparse, urljoin, parse_qs
 
+try:
+    import hyperscan
+except ImportError:  # Optional DFA matcher; fall back to the re-based scan
+    hyperscan = None
 
+# Single-pass regex for candidate URLs. The first alternative captures the
+# target of Markdown links: [text](url), [text](url "title") or [text](<url>).
+# Link text may not contain '[', and the target stops at whitespace, '<', '>'
+# or parentheses, so neither a stray '[' nor a link title swallows a URL.
+# The second captures plain URLs (simplified, focuses on finding things that
+# look like URLs): absolute URLs or paths starting with '/'. Link text is
+# captured too, since it may itself contain a plain URL. No match spans a
+# line break, so a single line can be scanned on its own.
+_PLAIN_URL_PATTERN = r'https?://[^\s"\'()<>]+|/[^\s"\'()<>]+'
+_LINK_RE = re.compile(
+    r"\[(?P<text>[^\[\]\n]*)\]\([^\S\n]*<?(?P<md>[^()<>\s]+)"
+    r"|(?P<plain>" + _PLAIN_URL_PATTERN + r")"
+)
+_PLAIN_URL_RE = re.compile(_PLAIN_URL_PATTERN)
+
+# First non-empty newsID value in a query string. The key is case-sensitive,
+# as with parse_qs, so spelling variants don't become distinct URLs.
+_NEWSID_RE = re.compile(r"(?:^|&)newsID=([^&]+)")
+
+if hyperscan is not None:
+    _HS_DATABASE = hyperscan.Database()
+    _HS_DATABASE.compile(
+        expressions=[rb"newsdetail\.aspx"],
+        ids=[0],
+        elements=1,
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST],
+    )
+    # Scratch space can't be shared between concurrent scans
+    _hs_local = threading.local()
+
+
+@lru_cache(maxsize=8192)
+def _cached_urlparse(url: str):
+    """Memoized urlparse; the same URLs are parsed repeatedly during a crawl."""
+    return urlparse(url)
+
+
+@lru_cache(maxsize=8192)
 def get_domain(url: str) -> str:
     """Extracts the domain (netloc) from a URL."""
     try:
-        parsed_url = urlparse(url)
+        parsed_url = _cached_urlparse(url)
         return parsed_url.netloc
     except Exception as e:
-        logging.error(f"Error parsing domain from URL '{url}': {e}")
+        logging.error("Error parsing domain from URL '%s': %s", url, e)
         return ""
 
 
+@lru_cache(maxsize=64)
+def _already_normalized_news_url_re(base_domain: str) -> re.Pattern[str]:
+    """
+    Matches absolute news URLs on base_domain that need no normalization:
+    no fragment and a numeric newsID as the only query parameter.
+    """
+    return re.compile(
+        r"https?://(?i:"
+        + re.escape(base_domain)
+        + r")/(?i:newsdetail\.aspx)\?newsID=\d+"
+    )
+
+
 def get_url_fingerprint(url: str) -> str:
     """
-    Generates an MD5 hash of the URL's path and query string for unique directory naming.
+    Generates a BLAKE2b-128 hash of the URL's path and query string, used as the
+    result store key.
     """
-    parsed_url = urlparse(url)
+    parsed_url = _cached_urlparse(url)
     data_to_hash = parsed_url.path
     if parsed_url.query:
         data_to_hash += "?" + parsed_url.query
-    return hashlib.md5(data_to_hash.encode("utf-8")).hexdigest()
+    return hashlib.blake2b(data_to_hash.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _has_numeric_news_id(query: str) -> bool:
+    """Checks whether the first newsID value in a query string is numeric."""
+    if "%" in query:
+        # Percent-encoded queries need parse_qs's decoding
+        news_id_values = parse_qs(query).get("newsID", [])
+        return bool(news_id_values) and news_id_values[0].isdigit()
+    match = _NEWSID_RE.search(query)
+    return match is not None and match.group(1).isdigit()
+
+
+def is_news_article_url(url: str) -> bool:
+    """Checks whether a URL is a NewsDetail.aspx article with a numeric newsID."""
+    parsed_url = _cached_urlparse(url)
+    return "/newsdetail.aspx" in parsed_url.path.lower() and _has_numeric_news_id(
+        parsed_url.query
+    )
+
+
+def _candidates_from_match(match: re.Match):
+    """Yields the candidate URL strings of one _LINK_RE match."""
+    if match.group("md") is None:
+        yield match.group("plain")
+        return
+    # Plain URLs used as link text, e.g. [https://...](/x), are links as well
+    yield from _PLAIN_URL_RE.findall(match.group("text"))
+    yield match.group("md")
+
+
+def _iter_candidates_re(markdown_content: str):
+    """Yields candidate URL strings using the single-pass _LINK_RE scan."""
+    for match in _LINK_RE.finditer(markdown_content):
+        yield from _candidates_from_match(match)
+
+
+def _iter_candidates_hyperscan(markdown_content: str):
+    """
+    Yields candidate URL strings around each NewsDetail.aspx occurrence found
+    by Hyperscan, which matches in guaranteed linear time.
+
+    Hyperscan only locates the hits; the candidates themselves come from
+    running _LINK_RE over each line with a hit, which yields the same matches
+    as a scan of the whole page because no match spans a line break.
+    """
+    scratch = getattr(_hs_local, "scratch", None)
+    if scratch is None:
+        scratch = _hs_local.scratch = hyperscan.Scratch(_HS_DATABASE)
+
+    data = markdown_content.encode("utf-8")
+    hits = []
+    _HS_DATABASE.scan(
+        data,
+        match_event_handler=lambda _id, start, end, _flags, ctx: ctx.append(start),
+        context=hits,
+        scratch=scratch,
+    )
+
+    # Hits arrive in offset order and start on an ASCII byte, so byte offsets
+    # map to str offsets by decoding only the bytes between consecutive hits.
+    hit_byte = hit = 0
+    line_end = -1
+    for next_hit_byte in hits:
+        hit += len(data[hit_byte:next_hit_byte].decode("utf-8"))
+        hit_byte = next_hit_byte
+        if hit < line_end:  # Same line as the previous hit
+            continue
+
+        line_start = markdown_content.rfind("\n", 0, hit) + 1
+        line_end = markdown_content.find("\n", hit)
+        if line_end == -1:
+            line_end = len(markdown_content)
+        for match in _LINK_RE.finditer(markdown_content, line_start, line_end):
+            yield from _candidates_from_match(match)
 
 
 def extract_news_urls(
@@ -38,31 +170,39 @@ def extract_news_urls(
     """
     extracted_urls = set()
 
-    # Regex for Markdown links: [text](url)
-    md_links_pattern = r"\[[^\]]*\]\(([^)]+)\)"
-    potential_urls_from_md_links = re.findall(md_links_pattern, markdown_content)
+    # Every news URL contains this path, so pages without it can't yield any
+    if "newsdetail.aspx" not in markdown_content.lower():
+        return extracted_urls
 
-    # Regex for plain URLs (simplified, focuses on finding things that look like URLs)
-    # This pattern aims to find absolute URLs or paths starting with '/'
-    plain_urls_pattern = r'(?:https?://[^\s"\'()<>]+|/[^\s"\'()<>]+)'
-    potential_plain_urls = re.findall(plain_urls_pattern, markdown_content)
+    # Loop-invariant values, computed once per page
+    current_page_scheme = _cached_urlparse(current_page_url).scheme
+    base_domain_lower = base_domain.lower()
+    already_normalized_re = _already_normalized_news_url_re(base_domain)
+    num_potential_strings = 0
 
-    all_potential_strings = potential_urls_from_md_links + potential_plain_urls
+    if hyperscan is not None:
+        potential_strings = _iter_candidates_hyperscan(markdown_content)
+    else:
+        potential_strings = _iter_candidates_re(markdown_content)
 
-    logging.debug(
-        f"Found {len(all_potential_strings)} potential URL strings in markdown from {current_page_url}"
-    )
-
-    for url_candidate_str in all_potential_strings:
+    # Stream matches straight into the filter instead of materializing a list
+    for url_candidate_str in potential_strings:
+        num_potential_strings += 1
         url_candidate_str = url_candidate_str.strip().strip("'\"")  # Clean up quotes
 
         # Quick check for the core pattern before more expensive parsing
+        lowered_candidate = url_candidate_str.lower()
         if not (
-            "newsdetail.aspx" in url_candidate_str.lower()
-            and "newsid=" in url_candidate_str.lower()
+            "newsdetail.aspx" in lowered_candidate and "newsid=" in lowered_candidate
         ):
             continue
 
+        # Fast path: already an absolute news URL on the target domain
+        if already_normalized_re.fullmatch(url_candidate_str):
+            extracted_urls.add(url_candidate_str)
+            logging.debug("EXTRACTED valid news URL: %s", url_candidate_str)
+            continue
+
         absolute_url = url_candidate_str
         # Resolve relative URLs
         if url_candidate_str.startswith("/"):
@@ -73,8 +213,7 @@ def extract_news_urls(
             absolute_url = urljoin(current_page_url, url_candidate_str)
 
         # Normalize URL: ensure scheme, remove fragment
-        parsed_temp_url = urlparse(absolute_url)
-        current_page_scheme = urlparse(current_page_url).scheme
+        parsed_temp_url = _cached_urlparse(absolute_url)
 
         # Ensure scheme if missing (e.g. if url_candidate_str was "merolagani.com/News...")
         if not parsed_temp_url.scheme:
@@ -84,35 +223,43 @@ def extract_news_urls(
                 absolute_url = urljoin(
                     current_page_url, absolute_url
                 )  # Re-join if needed
-                parsed_temp_url = urlparse(absolute_url)
+                parsed_temp_url = _cached_urlparse(absolute_url)
 
         absolute_url = parsed_temp_url._replace(fragment="").geturl()
 
         # Final validation
-        parsed_new_url = urlparse(absolute_url)
+        parsed_new_url = _cached_urlparse(absolute_url)
         if (
             parsed_new_url.netloc
-            and parsed_new_url.netloc.lower() == base_domain.lower()
+            and parsed_new_url.netloc.lower() == base_domain_lower
             and "/newsdetail.aspx" in parsed_new_url.path.lower()
             and "newsid=" in parsed_new_url.query.lower()
         ):
             # Check if newsID is numeric
-            query_params = parse_qs(parsed_new_url.query)
-            news_id_values = query_params.get(
-                "newsID", []
-            )  # parse_qs returns list of values
-            if news_id_values and news_id_values[0].isdigit():
+            if _has_numeric_news_id(parsed_new_url.query):
                 extracted_urls.add(absolute_url)
                 logging.debug(
-                    f"EXTRACTED valid news URL: {absolute_url} (from: {url_candidate_str})"
+                    "EXTRACTED valid news URL: %s (from: %s)",
+                    absolute_url,
+                    url_candidate_str,
                 )
             else:
                 logging.debug(
-                    f"REJECTED candidate (non-numeric newsID): {absolute_url} (from: {url_candidate_str})"
+                    "REJECTED candidate (non-numeric newsID): %s (from: %s)",
+                    absolute_url,
+                    url_candidate_str,
                 )
         else:
             logging.debug(
-                f"REJECTED candidate (domain/path/query mismatch): {absolute_url} (from: {url_candidate_str})"
+                "REJECTED candidate (domain/path/query mismatch): %s (from: %s)",
+                absolute_url,
+                url_candidate_str,
             )
 
+    logging.debug(
+        "Found %d potential URL strings in markdown from %s",
+        num_potential_strings,
+        current_page_url,
+    )
+
     return extracted_urls 
\ No newline at end of file